@@ -1,3 +1,9 @@
 # Init file for forestsens package
+import logging
+
 from .api import ForestSensAPI
+from .async_api import AsyncForestSensAPI
+
 
+# Library logging: leave handler and level configuration to the application
+logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -1,21 +1,188 @@
 import os
 import json
+import contextlib
+import itertools
+import shutil
+import statistics
+import tarfile
+import threading
+import time
 import requests
 import concurrent.futures
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
 from urllib.parse import urlparse, urljoin
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple, Union
 import logging
 
-# Configure logger
+# Logging is configured by the application; the package only installs a NullHandler
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
+
+# Chunk size used when streaming result files to disk
+DOWNLOAD_CHUNK_SIZE = 512 * 1024
+
+# Seconds that cached GET responses stay fresh
+ALGORITHMS_CACHE_TTL = 300
+BATCH_STATUS_CACHE_TTL = 1.0
+
+# Retry policy shared by both transports. Connection errors are retried for every
+# method; retries on these statuses are limited to idempotent methods so a POST
+# never creates a batch twice.
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+RETRY_ALLOWED_METHODS = ("HEAD", "GET")
+
+MEBIBYTE = 1024 * 1024
+
+# Multipart upload defaults. Parallel part uploads help fill the link for large
+# files, but more is not always better: for directories of many files the outer
+# thread pool already provides concurrency, so each file gets fewer part workers.
+UPLOAD_PART_SIZE = 64 * MEBIBYTE
+UPLOAD_PARALLEL_PROCESS_COUNT = 10
+
+# Single files above this size get one extra part worker per part beyond it
+LARGE_FILE_SIZE = 256 * MEBIBYTE
+LARGE_FILE_MAX_PARALLEL_PROCESS_COUNT = 32
+
+# Directories whose median file size is below this are treated as many-small-files
+SMALL_FILE_MEDIAN_SIZE = 4 * MEBIBYTE
+# Number of files sampled from the start of a directory walk to pick upload settings
+UPLOAD_SHAPE_SAMPLE_SIZE = 64
+# Sub-prefix for tar archives of packed small files, kept apart from the uploaded tree
+PACK_PREFIX = ".forestsens-packs/"
+
 
 try:
-    import oci
-    from oci.object_storage.transfer.upload_manager import UploadManager
-    from oci.object_storage.transfer.constants import MEBIBYTE
+    import orjson
 except ImportError:
-    oci = None  # OCI is not available in this environment
+    orjson = None  # Fall back to the stdlib json module
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # HTTP/2 support is not available in this environment
+
+
+@contextlib.contextmanager
+def _as_requests_errors() -> Iterator[None]:
+    """
+    Re-raise httpx errors as the requests exceptions the client documents.
+    """
+    try:
+        yield
+    except httpx.HTTPStatusError as e:
+        raise requests.exceptions.HTTPError(str(e)) from e
+    except httpx.HTTPError as e:
+        raise requests.exceptions.RequestException(str(e)) from e
+
+
+@contextlib.contextmanager
+def _as_requests_stream_errors() -> Iterator[None]:
+    """
+    Re-raise urllib3 errors from reading a raw response body as the requests
+    exceptions iter_content would have raised.
+    """
+    try:
+        yield
+    except urllib3.exceptions.ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e) from e
+    except urllib3.exceptions.DecodeError as e:
+        raise requests.exceptions.ContentDecodingError(e) from e
+    except urllib3.exceptions.SSLError as e:
+        raise requests.exceptions.SSLError(e) from e
+    except urllib3.exceptions.HTTPError as e:
+        raise requests.exceptions.ConnectionError(e) from e
+
+
+def _dump_json(obj: Any) -> bytes:
+    """
+    Serialize a request body, using orjson when it is installed.
+
+    The stdlib fallback rejects NaN/Infinity like requests' own `json=` encoding,
+    rather than emitting invalid JSON.
+    """
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+
+def _parse_json(response: Any) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    Decode errors from either parser or transport are raised as
+    requests.exceptions.InvalidJSONError.
+    """
+    try:
+        if orjson:
+            return orjson.loads(response.content)
+        return response.json()
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(f"Invalid JSON in response: {e}", response=response) from e
+
+
+def _iter_files(root: str) -> Iterator[Tuple[str, int]]:
+    """
+    Recursively yield (path, size) for every file below root.
+
+    Uses os.scandir so file types come from the directory entries and each file
+    is stat'ed once. Like os.walk, unreadable directories are skipped; files that
+    can't be stat'ed (e.g. removed mid-walk) are skipped as well, with a warning.
+    """
+    try:
+        it = os.scandir(root)
+    except OSError as e:
+        logger.warning(f"Skipping unreadable directory {root}: {e}")
+        return
+
+    with it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_files(entry.path)
+                elif entry.is_file():
+                    yield entry.path, entry.stat().st_size
+            except OSError as e:
+                logger.warning(f"Skipping {entry.path}: {e}")
+
+
+def _upload_shape(sizes: List[int]) -> Tuple[int, int, int]:
+    """
+    Pick (max_workers, part_size, parallel_process_count) for a directory upload
+    based on its file size distribution.
+    """
+    if statistics.median(sizes) < SMALL_FILE_MEDIAN_SIZE:
+        # Latency bound: many files in flight, little per-file parallelism
+        return min(32, len(sizes)), 8 * MEBIBYTE, 2
+    # Bandwidth bound: few files in flight, each split into parallel parts
+    return min(4, len(sizes)), UPLOAD_PART_SIZE, 8
+
+
+class _CheckedPipeReader:
+    """
+    Read end of a pipe fed by a writer thread. On any short read (which for a pipe
+    means EOF) it waits for the writer and re-raises its error, so a writer that
+    failed partway can't pass for a complete stream. The OCI SDK commits as soon as
+    a read returns less than the part size, so checking only on an empty read is
+    too late.
+    """
+    def __init__(self, stream: Any, writer: threading.Thread, errors: List[Exception]):
+        self._stream = stream
+        self._writer = writer
+        self._errors = errors
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        data = self._stream.read(size)
+        if size is None or size < 0 or len(data) < size:
+            self._writer.join()
+            if self._errors:
+                raise self._errors[0]
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
 
 
 class ForestSensAPI:
@@ -26,10 +193,18 @@ class ForestSensAPI:
         oci_config: Optional[Dict[str, Any]] = None,
         api_config_path: Optional[str] = None,
         oci_config_path: Optional[str] = None,
-        oci_profile: str = "DEFAULT"
+        oci_profile: str = "DEFAULT",
+        use_http2: bool = False,
+        prewarm: bool = True
     ):
         """
         Initialize the ForestSensAPI client with API and OCI configuration.
+
+        With `use_http2=True` all API calls and result downloads go through an
+        `httpx` HTTP/2 client, multiplexing concurrent requests over one connection.
+        Both transports apply the same retry policy (see RETRY_TOTAL).
+        With `prewarm=True` a background HEAD request resolves DNS and opens a pooled
+        connection to base_url, so the first real call skips the handshake.
         """
         default_api_config_path = os.path.expanduser("~/.forestsens/config.json")
         config_path = api_config_path or default_api_config_path
@@ -50,41 +225,154 @@ class ForestSensAPI:
             'Content-Type': 'application/json'
         }
 
-        if oci:
-            if isinstance(oci_config, dict):
-                self.oci_config = oci_config
+        # A single pooled session keeps connections alive between calls
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        retry = Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_FORCELIST,
+            allowed_methods=RETRY_ALLOWED_METHODS
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        self._client = None
+        if use_http2:
+            if not httpx:
+                raise ImportError("httpx is not available. Please install `httpx[http2]` to use HTTP/2.")
+            # No default headers, so the API token is never sent along with PAR downloads.
+            # The transport retries failed connections; status retries are done in _httpx_send.
+            self._client = httpx.Client(
+                timeout=30,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=RETRY_TOTAL,
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+                )
+            )
+
+        # (timestamp, response) caches for GETs whose data rarely changes between calls
+        self._algorithms_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._batch_status_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+        # The OCI SDK and client are only needed for uploads, so they are set up on first use
+        self._oci_config_raw = oci_config
+        self._oci_config_path = oci_config_path
+        self._oci_profile = oci_profile
+        self._object_storage = None
+
+        if prewarm:
+            threading.Thread(target=self._prewarm, daemon=True).start()
+
+    def _prewarm(self) -> None:
+        try:
+            (self._client or self._session).head(self.base_url, timeout=5)
+        except Exception:
+            pass  # Best effort; real calls will surface connection problems
+
+    def _get_object_storage(self) -> Any:
+        """
+        Import the OCI SDK and create the object storage client on first use.
+        """
+        if self._object_storage is None:
+            try:
+                import oci
+            except ImportError:
+                raise ImportError("OCI SDK is not available. Please install `oci` to use this feature.")
+
+            if isinstance(self._oci_config_raw, dict):
+                self.oci_config = self._oci_config_raw
             else:
-                config_file = oci_config_path or os.path.expanduser("~/.oci/config")
+                config_file = self._oci_config_path or os.path.expanduser("~/.oci/config")
                 if os.path.isfile(config_file):
-                    self.oci_config = oci.config.from_file(file_location=config_file, profile_name=oci_profile)
+                    self.oci_config = oci.config.from_file(file_location=config_file, profile_name=self._oci_profile)
                 else:
                     raise ValueError("OCI config must be a dict or a valid file path")
 
-            self.object_storage = oci.object_storage.ObjectStorageClient(self.oci_config)
+            self._object_storage = oci.object_storage.ObjectStorageClient(self.oci_config)
+        return self._object_storage
 
-    def get_all_batches(self, n: int = 20) -> Dict[str, Any]:
+    @property
+    def object_storage(self) -> Any:
+        return self._get_object_storage()
+
+    def close(self) -> None:
         """
-        Retrieve batches from ForestSens.
+        Close the underlying HTTP session and release pooled connections.
+        """
+        self._session.close()
+        if self._client is not None:
+            self._client.close()
+
+    def __enter__(self) -> "ForestSensAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _httpx_send(self, method: str, url: str, stream: bool = False, **kwargs: Any) -> Any:
+        """
+        Send a request over the HTTP/2 client, retrying idempotent methods on
+        RETRY_STATUS_FORCELIST responses with the same backoff as the requests session.
+        """
+        request = self._client.build_request(method, url, **kwargs)
+        for attempt in range(RETRY_TOTAL + 1):
+            response = self._client.send(request, stream=stream)
+            if (
+                attempt == RETRY_TOTAL
+                or method.upper() not in RETRY_ALLOWED_METHODS
+                or response.status_code not in RETRY_STATUS_FORCELIST
+            ):
+                return response
+            response.close()
+            retry_after = response.headers.get("Retry-After", "")
+            time.sleep(float(retry_after) if retry_after.isdigit() else RETRY_BACKOFF_FACTOR * 2 ** attempt)
+
+    def _request(self, method: str, path: str, action: str, body: Any = None, **kwargs: Any) -> Any:
         """
+        Send an API request and return the decoded JSON response.
+
+        Uses the HTTP/2 client if enabled, else the pooled session. Failures are
+        logged as "Failed to <action>" and re-raised as requests exceptions.
+        """
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        data = _dump_json(body) if body is not None else None
         try:
-            response = requests.get(f"{self.base_url}/batches", headers=self.headers, params={'n': n})
-            response.raise_for_status()
-            return response.json()
+            if self._client is not None:
+                with _as_requests_errors():
+                    response = self._httpx_send(method, url, content=data, headers=self.headers, **kwargs)
+                    response.raise_for_status()
+            else:
+                response = self._session.request(method, url, data=data, **kwargs)
+                response.raise_for_status()
+            return _parse_json(response)
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to get batches: {e}")
+            logger.error(f"Failed to {action}: {e}")
             raise
 
-    def get_algorithms(self) -> Dict[str, Any]:
+    def get_all_batches(self, n: int = 20) -> Dict[str, Any]:
+        """
+        Retrieve batches from ForestSens.
+        """
+        return self._request("GET", "/batches", "get batches", params={'n': n})
+
+    def get_algorithms(self, refresh: bool = False) -> Dict[str, Any]:
         """
         Retrieve available algorithms in ForestSens.
+
+        The algorithm catalog is cached for ALGORITHMS_CACHE_TTL seconds; pass
+        `refresh=True` to bypass the cache.
         """
-        try:
-            response = requests.get(f"{self.base_url}/algorithms", headers=self.headers)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to get algorithms: {e}")
-            raise
+        if not refresh and self._algorithms_cache is not None:
+            fetched_at, algorithms = self._algorithms_cache
+            if time.monotonic() - fetched_at < ALGORITHMS_CACHE_TTL:
+                return algorithms
+
+        algorithms = self._request("GET", "/algorithms", "get algorithms")
+        self._algorithms_cache = (time.monotonic(), algorithms)
+        return algorithms
 
     def init_batch(self, name: Optional[str] = None, algorithm: int = 26) -> Dict[str, Any]:
         """
@@ -94,53 +382,109 @@ class ForestSensAPI:
             'batch_name': name,
             'algorithm': algorithm
         }
-        try:
-            response = requests.post(f"{self.base_url}/batches", headers=self.headers, json=payload)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to initialize batch: {e}")
-            raise
+        return self._request("POST", "/batches", "initialize batch", body=payload)
 
     def start_batch(self, batch_id: Union[int, str]) -> Dict[str, Any]:
         """
         Start a previously initialized batch by its ID.
         """
-        try:
-            response = requests.post(f"{self.base_url}/batches/{batch_id}", headers=self.headers, json={})
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to start batch {batch_id}: {e}")
-            raise
+        self._batch_status_cache.pop(str(batch_id), None)
+        return self._request("POST", f"/batches/{batch_id}", f"start batch {batch_id}", body={})
 
-    def get_batch_status(self, batch_id: Union[int, str]) -> Dict[str, Any]:
+    def get_batch_status(self, batch_id: Union[int, str], refresh: bool = False) -> Dict[str, Any]:
         """
         Get the status of a batch by its ID.
+
+        Responses are cached for BATCH_STATUS_CACHE_TTL seconds so tight polling
+        loops don't hammer the server; pass `refresh=True` to bypass the cache.
         """
-        try:
-            response = requests.get(f"{self.base_url}/batches/{batch_id}", headers=self.headers)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to get status for batch {batch_id}: {e}")
-            raise
+        key = str(batch_id)
+        if not refresh and key in self._batch_status_cache:
+            fetched_at, status = self._batch_status_cache[key]
+            if time.monotonic() - fetched_at < BATCH_STATUS_CACHE_TTL:
+                return status
+
+        status = self._request("GET", f"/batches/{batch_id}", f"get status for batch {batch_id}")
+        self._batch_status_cache[key] = (time.monotonic(), status)
+        return status
 
     def get_results(self, batch_id: Union[int, str]) -> Dict[str, Any]:
         """
         Retrieve result metadata for a given batch.
         """
+        return self._request("GET", f"/batches/{batch_id}/results", f"get results for batch {batch_id}")
+
+    def batch(self, requests_list: List[Dict[str, Any]], max_workers: int = 8) -> List[Any]:
+        """
+        Issue several API requests concurrently over the pooled session.
+
+        The ForestSens API has no server-side batch endpoint, so the requests are
+        overlapped on the client instead of being sent one round-trip at a time.
+
+        Args:
+            requests_list (List[Dict[str, Any]]): Request specs with keys `method` (default "GET"),
+                `path` (relative to base_url) and optional `params` and `json`,
+                e.g. `{"method": "GET", "path": "/batches", "params": {"n": 3}}`.
+            max_workers (int): Maximum number of requests in flight.
+
+        Returns:
+            List[Any]: Decoded JSON responses, in the same order as `requests_list`.
+        """
+        def send(spec: Dict[str, Any]) -> Any:
+            method = spec.get("method", "GET").upper()
+            path = spec["path"]
+            return self._request(method, path, f"{method} {path}", body=spec.get("json"), params=spec.get("params"))
+
+        if not requests_list:
+            return []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(requests_list))) as executor:
+            return list(executor.map(send, requests_list))
+
+    def _download_one(self, file_info: Dict[str, Any], par_url: str, output_dir: str) -> str:
+        """
+        Download a single result file from the PAR URL into output_dir.
+        """
+        filename = file_info["name"]
+        file_url = urljoin(par_url, filename)
+        local_path = os.path.join(output_dir, filename)
+
+        logger.info(f"Downloading {filename}...")
         try:
-            response = requests.get(f"{self.base_url}/batches/{batch_id}/results", headers=self.headers)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to get results for batch {batch_id}: {e}")
+            if self._client is not None:
+                with _as_requests_errors():
+                    response = self._httpx_send("GET", file_url, stream=True)
+                    try:
+                        response.raise_for_status()
+                        with open(local_path, "wb") as f:
+                            for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                                f.write(chunk)
+                    finally:
+                        response.close()
+            else:
+                # PAR URLs carry their own auth; don't leak the API token to object storage
+                with self._session.get(file_url, stream=True, headers={'apitoken': None, 'Content-Type': None}) as response:
+                    response.raise_for_status()
+                    # Copy straight from the raw stream so the loop runs in C, not through iter_content
+                    response.raw.decode_content = True
+                    with _as_requests_stream_errors(), open(local_path, "wb") as f:
+                        shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
+        except Exception:
+            # Don't leave a truncated file behind that looks like a finished download
+            if os.path.exists(local_path):
+                os.remove(local_path)
             raise
+        logger.info(f"Saved to {local_path}")
+        return local_path
 
-    def download_results(self, batch_id: Union[int, str], output_dir: str = "downloads") -> None:
+    def download_results(self, batch_id: Union[int, str], output_dir: str = "downloads", max_workers: int = 8) -> None:
         """
         Download result files for a given batch using the PAR URL.
+
+        Args:
+            batch_id (Union[int, str]): ID of the batch.
+            output_dir (str): Directory to save the result files in.
+            max_workers (int): Number of files to download concurrently.
         """
         results = self.get_results(batch_id)
         files = results.get("result_files", [])
@@ -151,50 +495,81 @@ class ForestSensAPI:
 
         os.makedirs(output_dir, exist_ok=True)
 
-        for file_info in files:
-            filename = file_info["name"]
-            file_url = urljoin(par_url, filename)
-            local_path = os.path.join(output_dir, filename)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._download_one, file_info, par_url, output_dir): file_info["name"]
+                for file_info in files
+            }
 
-            logger.info(f"Downloading {filename}...")
-            try:
-                response = requests.get(file_url, stream=True)
-                response.raise_for_status()
-                with open(local_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                logger.info(f"Saved to {local_path}")
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Failed to download {filename}: {e}")
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except requests.exceptions.RequestException as e:
+                    logger.error(f"Failed to download {futures[future]}: {e}")
 
     class SimpleProgress:
         """
         A simple progress tracker for file uploads.
+
+        Prints at most once per `interval` seconds per file; all instances share a
+        lock so concurrent uploads don't contend on or interleave their output.
         """
+        _print_lock = threading.Lock()
+        interval = 0.2
+
         def __init__(self, total_size: int, filename: str):
             self.total = total_size
             self.uploaded = 0
             self.filename = filename
+            self._last_print = 0.0
 
         def __call__(self, bytes_uploaded: int):
-            self.uploaded += bytes_uploaded
-            percent = (self.uploaded / self.total) * 100
-            print(f"\r{self.filename}: {percent:.2f}% uploaded", end='', flush=True)
+            with self._print_lock:
+                self.uploaded += bytes_uploaded
+                now = time.monotonic()
+                if now - self._last_print < self.interval and self.uploaded < self.total:
+                    return
+                self._last_print = now
+                percent = (self.uploaded / self.total) * 100
+                print(f"\r{self.filename}: {percent:.2f}% uploaded", end='', flush=True)
 
         def done(self, success: bool = True):
             status = "OK" if success else "FAILED TO UPLOAD"
-            print(f"\r{self.filename}: 100.00% uploaded - {status}")
-    
-    def upload_files(self, upload_url: str, local_path: str) -> None:
+            with self._print_lock:
+                print(f"\r{self.filename}: 100.00% uploaded - {status}")
+
+    def upload_files(
+        self,
+        upload_url: str,
+        local_path: str,
+        parallel_process_count: Optional[int] = None,
+        part_size: Optional[int] = None,
+        pack_small: bool = False,
+        pack_threshold: int = 1 * MEBIBYTE,
+        pack_size: int = 256 * MEBIBYTE
+    ) -> None:
         """
         Uploads files to an OCI Object Storage bucket using a pre-authenticated request (PAR) URL.
 
         Args:
             upload_url (str): The PAR URL provided by the ForestSens API.
             local_path (str): Path to a file or directory to upload.
+            parallel_process_count (Optional[int]): Number of parts uploaded in parallel per file.
+                Defaults to 10 for a single file, plus one per part beyond the first 256 MiB (up to
+                32); for directories it is picked from the file sizes.
+            part_size (Optional[int]): Multipart upload part size in bytes. Defaults to 64 MiB for a
+                single file; for directories it is picked from the file sizes.
+            pack_small (bool): For directories, stream files smaller than `pack_threshold` into tar
+                archives of about `pack_size` bytes instead of uploading them one object each. The
+                archives are stored as `.forestsens-packs/packed-NNNNN.tar` under the upload prefix
+                and must be extracted (e.g. `tar -xf`) before processing, as the API does not unpack
+                them. Raises ValueError if `local_path` already contains a `.forestsens-packs`
+                entry, as its objects could be overwritten by the archives.
+            pack_threshold (int): Size in bytes below which a file is packed.
+            pack_size (int): Approximate number of file bytes per tar archive.
         """
-        if not oci:
-            raise ImportError("OCI SDK is not available. Please install `oci` to use this feature.")
+        object_storage = self._get_object_storage()
+        from oci.object_storage.transfer.upload_manager import UploadManager
 
         parsed = urlparse(upload_url)
         path_parts = parsed.path.strip('/').split('/')
@@ -203,24 +578,50 @@ class ForestSensAPI:
         bucket = path_parts[3]
         prefix = '/'.join(path_parts[5:]).rstrip('/') + '/'
 
+        if os.path.isdir(local_path):
+            if pack_small and os.path.lexists(os.path.join(local_path, PACK_PREFIX.rstrip("/"))):
+                raise ValueError(f"{local_path} contains {PACK_PREFIX.rstrip('/')}, which is reserved for packed uploads")
+            # Walk lazily so uploads start before the whole tree has been listed
+            files = _iter_files(local_path)
+            sample = list(itertools.islice(files, UPLOAD_SHAPE_SAMPLE_SIZE))
+            if not sample:
+                logger.warning(f"No files found in {local_path}")
+                return
+            max_workers, auto_part_size, auto_process_count = _upload_shape([size for _, size in sample])
+            files = itertools.chain(sample, files)
+        else:
+            max_workers, auto_part_size, auto_process_count = 1, UPLOAD_PART_SIZE, UPLOAD_PARALLEL_PROCESS_COUNT
+            file_size = os.path.getsize(local_path) if os.path.isfile(local_path) else 0
+            if file_size > LARGE_FILE_SIZE:
+                # A single large file has no outer pool, so let its parts carry the concurrency
+                extra_parts = -(-(file_size - LARGE_FILE_SIZE) // (part_size or auto_part_size))
+                auto_process_count = min(auto_process_count + extra_parts, LARGE_FILE_MAX_PARALLEL_PROCESS_COUNT)
+
+        part_size = part_size or auto_part_size
+        parallel_process_count = parallel_process_count or auto_process_count
+
         upload_manager = UploadManager(
-            self.object_storage,
+            object_storage,
             allow_parallel_uploads=True,
-            parallel_process_count=3
+            parallel_process_count=parallel_process_count
         )
 
-        def upload_one(file_path: str, object_name: str) -> Dict[str, Any]:
+        def upload_one(file_path: str, object_name: str, file_size: Optional[int] = None) -> Dict[str, Any]:
             try:
-                file_size = os.path.getsize(file_path)
+                if file_size is None:
+                    file_size = os.path.getsize(file_path)
                 filename = os.path.basename(file_path)
                 progress = self.SimpleProgress(file_size, filename)
 
+                # Pass the path rather than an open stream or mmap: upload_file reads each
+                # part straight from disk at its offset, while upload_stream would buffer
+                # whole parts in memory. os.sendfile can't be used as the socket is TLS.
                 response = upload_manager.upload_file(
                     namespace,
                     bucket,
                     object_name,
                     file_path,
-                    part_size=2 * MEBIBYTE,
+                    part_size=part_size,
                     progress_callback=progress
                 )
 
@@ -240,25 +641,94 @@ class ForestSensAPI:
                     "error": str(e)
                 }
 
+        def upload_pack(members: List[Tuple[str, str]], object_name: str) -> Dict[str, Any]:
+            # Tar the files into a pipe on one thread while upload_stream consumes it,
+            # so no archive is ever written to disk
+            pack_name = os.path.basename(object_name)
+            read_fd, write_fd = os.pipe()
+            errors = []
+
+            def write_tar() -> None:
+                try:
+                    with os.fdopen(write_fd, "wb") as pipe_writer:
+                        # Store symlinked inputs by content, as individual uploads do
+                        with tarfile.open(fileobj=pipe_writer, mode="w|", dereference=True) as tar:
+                            for fp, arcname in members:
+                                tar.add(fp, arcname=arcname)
+                except Exception as e:
+                    errors.append(e)
+
+            writer = threading.Thread(target=write_tar, daemon=True)
+            writer.start()
+            try:
+                # If the writer fails, the reader raises at EOF so the upload is aborted
+                # rather than committing a truncated archive
+                with os.fdopen(read_fd, "rb") as pipe_reader:
+                    stream = _CheckedPipeReader(pipe_reader, writer, errors)
+                    response = upload_manager.upload_stream(namespace, bucket, object_name, stream, part_size=part_size)
+                writer.join()
+                if errors:
+                    raise errors[0]
+                logger.info(f"Uploaded {len(members)} files as {pack_name}")
+                return {
+                    "file": pack_name,
+                    "success": True,
+                    "etag": response.headers.get("etag")
+                }
+            except Exception as e:
+                return {
+                    "file": pack_name,
+                    "success": False,
+                    "error": str(e)
+                }
+
         if os.path.isdir(local_path):
-            all_files = [
-                os.path.join(dp, f)
-                for dp, _, filenames in os.walk(local_path)
-                for f in filenames
-            ]
-            logger.info(f"Uploading {len(all_files)} files to '{namespace}/{bucket}/{prefix}'...")
-
-            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-                futures = []
-                for fp in all_files:
-                    rel = os.path.relpath(fp, local_path).replace("\\", "/")
-                    oname = prefix + rel
-                    futures.append(executor.submit(upload_one, fp, oname))
+            logger.info(f"Uploading files to '{namespace}/{bucket}/{prefix}'...")
 
-                for future in concurrent.futures.as_completed(futures):
+            def report(done: Iterable[concurrent.futures.Future]) -> None:
+                for future in done:
                     result = future.result()
                     if not result.get("success", False):
                         logger.error(f"Failed to upload {result.get('file', 'Unknown')}: {result.get('error', 'No error message')}")
+
+            # _iter_files yields paths as os.path.join(local_path, ...), so the relative
+            # part is a plain slice; only non-POSIX separators need rewriting
+            base_len = len(os.path.join(local_path, ""))
+            native_sep = os.sep if os.sep != "/" else None
+
+            file_count = 0
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Keep a bounded window of submitted uploads so the walk never runs far ahead
+                pending = set()
+                pack: List[Tuple[str, str]] = []
+                pack_bytes = 0
+                pack_count = 0
+                for fp, size in files:
+                    if len(pending) >= max_workers * 2:
+                        done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                        report(done)
+                    rel = fp[base_len:]
+                    if native_sep:
+                        rel = rel.replace(native_sep, "/")
+                    file_count += 1
+
+                    if pack_small and size < pack_threshold:
+                        pack.append((fp, rel))
+                        pack_bytes += size
+                        if pack_bytes >= pack_size:
+                            pending.add(executor.submit(upload_pack, pack, f"{prefix}{PACK_PREFIX}packed-{pack_count:05d}.tar"))
+                            pack, pack_bytes, pack_count = [], 0, pack_count + 1
+                        continue
+
+                    oname = prefix + rel
+                    pending.add(executor.submit(upload_one, fp, oname, size))
+
+                if pack:
+                    pending.add(executor.submit(upload_pack, pack, f"{prefix}{PACK_PREFIX}packed-{pack_count:05d}.tar"))
+
+                report(concurrent.futures.as_completed(pending))
+
+            logger.info(f"Processed {file_count} files")
         else:
             filename = os.path.basename(local_path)
             object_name = prefix + filename
@@ -268,7 +738,14 @@ class ForestSensAPI:
             else:
                 logger.error(f"Failed to upload {result['file']}: {result['error']}")
 
-    def run_batch(self, algorithm: int, input_path: str, name: Optional[str] = None) -> Dict[str, Any]:
+    def run_batch(
+        self,
+        algorithm: int,
+        input_path: str,
+        name: Optional[str] = None,
+        parallel_process_count: Optional[int] = None,
+        part_size: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Runs a complete batch process: initializes, uploads files, starts the batch, and checks status.
 
@@ -276,6 +753,8 @@ class ForestSensAPI:
             algorithm (int): Algorithm ID to use.
             input_path (str): Path to input file or directory.
             name (Optional[str]): Optional name for the batch.
+            parallel_process_count (Optional[int]): Parallel part uploads per file, see `upload_files`.
+            part_size (Optional[int]): Multipart upload part size in bytes, see `upload_files`.
 
         Returns:
             Dict[str, Any]: Batch metadata including ID, start response, and status.
@@ -287,7 +766,7 @@ class ForestSensAPI:
         batch_id = batch_info["batch_id"]
 
         logger.info("Uploading files...")
-        self.upload_files(upload_url, input_path)
+        self.upload_files(upload_url, input_path, parallel_process_count=parallel_process_count, part_size=part_size)
 
         logger.info("Starting batch...")
         start_response = self.start_batch(batch_id)
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import requests
+from typing import Optional, Dict, Any, Callable, Iterable, List, Union
+
+from .api import ForestSensAPI, _as_requests_errors, _parse_json
+
+logger = logging.getLogger(__name__)
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # httpx is not available in this environment
+
+# Batch status values assumed to be final. The API reference does not document the
+# status values, so this is a best guess; pass `is_done` to poll_until_done if it differs
+BATCH_FINAL_STATUSES = ("finished", "completed", "failed", "error", "cancelled")
+
+
+class AsyncForestSensAPI(ForestSensAPI):
+    """
+    ForestSensAPI client with asyncio variants of the read-only endpoints.
+
+    All async calls share one long-lived HTTP/2 `httpx.AsyncClient`, so many
+    concurrent status polls are multiplexed over a single connection.
+    """
+    def __init__(self, *args: Any, **kwargs: Any):
+        if not httpx:
+            raise ImportError("httpx is not available. Please install `httpx[http2]` to use the async client.")
+
+        # Pre-warming would only open a connection on the sync transport, which the
+        # async calls never use
+        kwargs["prewarm"] = False
+        super().__init__(*args, **kwargs)
+        self._async_client = httpx.AsyncClient(
+            http2=True,
+            headers=self.headers,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+
+    async def aclose(self) -> None:
+        """
+        Close the async HTTP client and the underlying sync session.
+        """
+        await self._async_client.aclose()
+        self.close()
+
+    async def __aenter__(self) -> "AsyncForestSensAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def _aget(self, path: str, description: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        try:
+            with _as_requests_errors():
+                response = await self._async_client.get(f"{self.base_url}{path}", params=params)
+                response.raise_for_status()
+            return _parse_json(response)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to {description}: {e}")
+            raise
+
+    async def aget_all_batches(self, n: int = 20) -> Dict[str, Any]:
+        """
+        Retrieve batches from ForestSens.
+        """
+        return await self._aget("/batches", "get batches", params={'n': n})
+
+    async def aget_algorithms(self) -> Dict[str, Any]:
+        """
+        Retrieve available algorithms in ForestSens.
+        """
+        return await self._aget("/algorithms", "get algorithms")
+
+    async def aget_batch_status(self, batch_id: Union[int, str]) -> Dict[str, Any]:
+        """
+        Get the status of a batch by its ID.
+        """
+        return await self._aget(f"/batches/{batch_id}", f"get status for batch {batch_id}")
+
+    async def aget_results(self, batch_id: Union[int, str]) -> Dict[str, Any]:
+        """
+        Retrieve result metadata for a given batch.
+        """
+        return await self._aget(f"/batches/{batch_id}/results", f"get results for batch {batch_id}")
+
+    async def aget_batch_statuses(self, batch_ids: Iterable[Union[int, str]]) -> List[Dict[str, Any]]:
+        """
+        Get the status of several batches concurrently, in the order given.
+        """
+        return list(await asyncio.gather(*(self.aget_batch_status(batch_id) for batch_id in batch_ids)))
+
+    async def poll_until_done(
+        self,
+        batch_id: Union[int, str],
+        interval: float = 5,
+        is_done: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = 3600
+    ) -> Dict[str, Any]:
+        """
+        Poll a batch until it reaches a final status and return that status.
+
+        Args:
+            batch_id (Union[int, str]): ID of the batch.
+            interval (float): Seconds to wait between polls.
+            is_done (Optional[Callable]): Predicate on the status response. Defaults to
+                checking its `status` field against BATCH_FINAL_STATUSES, which is a guess
+                as the API does not document its status values.
+            timeout (Optional[float]): Seconds to keep polling before raising
+                asyncio.TimeoutError, or None to poll indefinitely.
+        """
+        if is_done is None:
+            def is_done(status: Dict[str, Any]) -> bool:
+                return str(status.get("status", "")).lower() in BATCH_FINAL_STATUSES
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            status = await self.aget_batch_status(batch_id)
+            if is_done(status):
+                return status
+            if deadline is not None and loop.time() + interval > deadline:
+                raise asyncio.TimeoutError(f"Batch {batch_id} did not finish within {timeout} seconds")
+            await asyncio.sleep(interval)
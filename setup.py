@@ -13,6 +13,11 @@ setup(
         'requests',
         'tqdm'
     ],
+    extras_require={
+        'async': ['httpx[http2]'],
+        'http2': ['httpx[http2]'],
+        'fast': ['orjson'],
+    },
     python_requires='>=3.7',
     classifiers=[
         'Programming Language :: Python :: 3',
@@ -1,63 +1,462 @@
 # tests/test_api.py
+import asyncio
+import io
+import json
+import os
+import sys
+import tarfile
+import tempfile
+import threading
 import unittest
-from unittest.mock import patch, MagicMock
-from ForestSensAPI import ForestSensAPI
+from unittest.mock import patch, MagicMock, AsyncMock
+from ForestSensAPI import ForestSensAPI, AsyncForestSensAPI
+from ForestSensAPI import async_api
+from ForestSensAPI import api as api_module
+from ForestSensAPI.api import MEBIBYTE, _dump_json, _iter_files, _upload_shape
 import requests
+import urllib3
+
+
+def _response(payload):
+    response = MagicMock(status_code=200, content=json.dumps(payload).encode("utf-8"))
+    response.json.return_value = payload
+    return response
+
+
+class FakeUploadManager:
+    """
+    Stand-in for oci's UploadManager that records uploaded object contents.
+    """
+    uploads = {}
+    lock = threading.Lock()
+
+    def __init__(self, client, allow_parallel_uploads=True, parallel_process_count=None):
+        self.parallel_process_count = parallel_process_count
+        type(self).last_parallel_process_count = parallel_process_count
+
+    def _store(self, object_name, data):
+        with self.lock:
+            self.uploads[object_name] = data
+        return MagicMock(headers={"etag": "etag"})
+
+    def upload_file(self, namespace, bucket, object_name, file_path, part_size=None, progress_callback=None):
+        with open(file_path, "rb") as f:
+            return self._store(object_name, f.read())
+
+    def upload_stream(self, namespace, bucket, object_name, stream_ref, part_size=None):
+        # Like the SDK, treat the first short read as the end of the stream
+        part_size = part_size or 8192
+        chunks = []
+        while True:
+            chunk = stream_ref.read(part_size)
+            chunks.append(chunk)
+            if len(chunk) < part_size:
+                break
+        return self._store(object_name, b"".join(chunks))
+
+
+UPLOAD_URL = "https://objectstorage.example.com/n/ns/b/bucket/o/batch1/"
 
 
 class TestForestSensAPI(unittest.TestCase):
     def setUp(self):
-        self.api = ForestSensAPI()
+        self.api = ForestSensAPI(prewarm=False)
+
+    def tearDown(self):
+        self.api.close()
+
+    def _upload(self, local_path, **kwargs):
+        """
+        Run upload_files against a stubbed OCI SDK and return {object_name: data}.
+        """
+        upload_module = MagicMock(UploadManager=FakeUploadManager)
+        modules = {
+            "oci": MagicMock(),
+            "oci.object_storage": MagicMock(),
+            "oci.object_storage.transfer": MagicMock(),
+            "oci.object_storage.transfer.upload_manager": upload_module,
+        }
+        FakeUploadManager.uploads = {}
+        self.api._object_storage = MagicMock()
+        with patch.dict(sys.modules, modules), patch("builtins.print"):
+            self.api.upload_files(UPLOAD_URL, local_path, **kwargs)
+        return FakeUploadManager.uploads
 
-    @patch("requests.get")
+    def _make_tree(self, root, files):
+        for name, data in files.items():
+            path = os.path.join(root, *name.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+
+    @patch.object(requests.Session, "request")
     def test_get_all_batches(self, mock_get):
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {"batches": []}
+        mock_get.return_value = _response({"batches": []})
         result = self.api.get_all_batches()
         self.assertIn("batches", result)
 
-    @patch("requests.get")
+    @patch.object(requests.Session, "request")
     def test_get_algorithms(self, mock_get):
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {"algorithms": []}
+        mock_get.return_value = _response({"algorithms": []})
         result = self.api.get_algorithms()
         self.assertIn("algorithms", result)
 
-    @patch("requests.get")
+    @patch.object(requests.Session, "request")
+    def test_get_algorithms_cached(self, mock_get):
+        mock_get.return_value = _response({"algorithms": []})
+        self.api.get_algorithms()
+        self.api.get_algorithms()
+        self.assertEqual(mock_get.call_count, 1)
+        self.api.get_algorithms(refresh=True)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch.object(requests.Session, "request")
+    def test_get_batch_status_cached(self, mock_request):
+        mock_request.return_value = _response({"status": "running"})
+        with patch.object(api_module.time, "monotonic", return_value=100.0) as mock_clock:
+            self.api.get_batch_status(1)
+            self.api.get_batch_status(1)
+            self.assertEqual(mock_request.call_count, 1)
+            self.api.get_batch_status(1, refresh=True)
+            self.assertEqual(mock_request.call_count, 2)
+
+            mock_clock.return_value = 100.0 + api_module.BATCH_STATUS_CACHE_TTL
+            self.api.get_batch_status(1)
+            self.assertEqual(mock_request.call_count, 3)
+
+            self.api.start_batch(1)
+            self.api.get_batch_status(1)
+            self.assertEqual(mock_request.call_count, 5)
+
+    @patch.object(requests.Session, "request")
     def test_get_batch_status(self, mock_get):
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {"status": "running"}
+        mock_get.return_value = _response({"status": "running"})
         result = self.api.get_batch_status(batch_id=123)
         self.assertEqual(result["status"], "running")
 
-    @patch("requests.post")
+    @patch.object(requests.Session, "request")
     def test_init_batch(self, mock_post):
-        mock_post.return_value.status_code = 200
-        mock_post.return_value.json.return_value = {"batch_id": 1}
+        mock_post.return_value = _response({"batch_id": 1})
         result = self.api.init_batch(name="test")
         self.assertEqual(result["batch_id"], 1)
 
-    @patch("requests.post")
+    @patch.object(requests.Session, "request")
     def test_start_batch(self, mock_post):
-        mock_post.return_value.status_code = 200
-        mock_post.return_value.json.return_value = {"started": True}
+        mock_post.return_value = _response({"started": True})
         result = self.api.start_batch(batch_id=1)
         self.assertTrue(result["started"])
 
-    @patch("requests.get")
+    @patch.object(requests.Session, "request")
     def test_get_results(self, mock_get):
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {"result_files": [], "par_url": "https://dummy.url"}
+        mock_get.return_value = _response({"result_files": [], "par_url": "https://dummy.url"})
         result = self.api.get_results(batch_id=1)
         self.assertIn("result_files", result)
         self.assertIn("par_url", result)
 
-    @patch("requests.get")
+    @patch.object(requests.Session, "request")
     def test_get_all_batches_error(self, mock_get):
         mock_get.side_effect = requests.exceptions.RequestException("API error")
         with self.assertRaises(requests.exceptions.RequestException):
             self.api.get_all_batches()
 
+    @patch.object(requests.Session, "request")
+    def test_invalid_json_raises_request_exception(self, mock_request):
+        response = MagicMock(status_code=201, content=b"")
+        response.json.side_effect = ValueError("Expecting value")
+        mock_request.return_value = response
+        with self.assertRaises(requests.exceptions.InvalidJSONError):
+            self.api.start_batch(batch_id=1)
+
+    @patch.object(requests.Session, "request")
+    def test_batch(self, mock_request):
+        mock_request.return_value = _response({"ok": True})
+        result = self.api.batch([
+            {"method": "GET", "path": "/batches", "params": {"n": 3}},
+            {"path": "batches/1"},
+        ])
+        self.assertEqual(result, [{"ok": True}, {"ok": True}])
+        urls = sorted(call[0][1] for call in mock_request.call_args_list)
+        self.assertEqual(urls, [f"{self.api.base_url}/batches", f"{self.api.base_url}/batches/1"])
+
+    @patch.object(requests.Session, "get")
+    def test_download_results(self, mock_get):
+        def fake_get(*args, **kwargs):
+            response = MagicMock(raw=io.BytesIO(b"data"))
+            response.__enter__.return_value = response
+            return response
+
+        mock_get.side_effect = fake_get
+        results = {"result_files": [{"name": "a.tif"}, {"name": "b.tif"}], "par_url": "https://dummy.url/o/"}
+        with patch.object(self.api, "get_results", return_value=results), tempfile.TemporaryDirectory() as tmp:
+            self.api.download_results(batch_id=1, output_dir=tmp)
+            self.assertEqual(sorted(os.listdir(tmp)), ["a.tif", "b.tif"])
+            with open(os.path.join(tmp, "a.tif"), "rb") as f:
+                self.assertEqual(f.read(), b"data")
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch.object(requests.Session, "get")
+    def test_download_results_dropped_connection(self, mock_get):
+        def fake_get(url, *args, **kwargs):
+            response = MagicMock(raw=io.BytesIO(b"data"))
+            if url.endswith("b.tif"):
+                error = urllib3.exceptions.ProtocolError("Connection broken: IncompleteRead")
+                response.raw = MagicMock(read=MagicMock(side_effect=[b"partial", error]))
+            response.__enter__.return_value = response
+            return response
+
+        mock_get.side_effect = fake_get
+        results = {"result_files": [{"name": "a.tif"}, {"name": "b.tif"}], "par_url": "https://dummy.url/o/"}
+        with patch.object(self.api, "get_results", return_value=results), tempfile.TemporaryDirectory() as tmp, \
+                self.assertLogs("ForestSensAPI.api", level="ERROR") as logs:
+            self.api.download_results(batch_id=1, output_dir=tmp)
+            self.assertEqual(os.listdir(tmp), ["a.tif"])
+        self.assertIn("Failed to download b.tif", "\n".join(logs.output))
+
+    @unittest.skipIf(api_module.httpx is None, "httpx is not installed")
+    def test_http2_client_used_for_requests(self):
+        with ForestSensAPI(use_http2=True, prewarm=False) as api:
+            with patch.object(api._client, "send", return_value=_response({"batches": []})) as mock_send:
+                self.assertEqual(api.get_all_batches(), {"batches": []})
+            request = mock_send.call_args[0][0]
+            self.assertEqual(request.headers["apitoken"], api.headers["apitoken"])
+
+    @unittest.skipIf(api_module.httpx is None, "httpx is not installed")
+    @patch("time.sleep")
+    def test_http2_client_retries_idempotent_requests(self, mock_sleep):
+        unavailable = MagicMock(status_code=503, headers={})
+        with ForestSensAPI(use_http2=True, prewarm=False) as api:
+            with patch.object(api._client, "send", side_effect=[unavailable, _response({"ok": True})]) as mock_send:
+                self.assertEqual(api.get_algorithms(), {"ok": True})
+            self.assertEqual(mock_send.call_count, 2)
+            mock_sleep.assert_called_once_with(api_module.RETRY_BACKOFF_FACTOR)
+
+            unavailable.raise_for_status.side_effect = api_module.httpx.HTTPStatusError(
+                "503", request=MagicMock(), response=unavailable)
+            with patch.object(api._client, "send", return_value=unavailable) as mock_send:
+                with self.assertRaises(requests.exceptions.HTTPError):
+                    api.start_batch(1)
+            self.assertEqual(mock_send.call_count, 1)
+
+    def test_object_storage_is_lazy(self):
+        self.assertIsNone(self.api._object_storage)
+
+    def test_dump_json_without_orjson(self):
+        with patch.object(api_module, "orjson", None):
+            self.assertEqual(json.loads(_dump_json({"a": 1})), {"a": 1})
+            with self.assertRaises(ValueError):
+                _dump_json({"a": float("nan")})
+
+    def test_iter_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, "sub"))
+            for name, data in (("a.tif", b"abc"), (os.path.join("sub", "b.tif"), b"12345")):
+                with open(os.path.join(tmp, name), "wb") as f:
+                    f.write(data)
+            found = sorted((os.path.relpath(p, tmp), size) for p, size in _iter_files(tmp))
+        self.assertEqual(found, [("a.tif", 3), (os.path.join("sub", "b.tif"), 5)])
+
+    def test_iter_files_skips_unreadable_entries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, "sub"))
+            for name in ("a.tif", os.path.join("sub", "b.tif")):
+                with open(os.path.join(tmp, name), "wb") as f:
+                    f.write(b"abc")
+            real_scandir = os.scandir
+
+            def scandir(path):
+                if os.path.basename(path) == "sub":
+                    raise PermissionError("denied")
+                return real_scandir(path)
+
+            with patch("os.scandir", side_effect=scandir):
+                found = [os.path.relpath(p, tmp) for p, _ in _iter_files(tmp)]
+        self.assertEqual(found, ["a.tif"])
+
+    def test_upload_object_names(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self._make_tree(tmp, {"a.tif": b"a", "sub/deep/b.tif": b"b"})
+            expected = {"batch1/a.tif": b"a", "batch1/sub/deep/b.tif": b"b"}
+            self.assertEqual(self._upload(tmp), expected)
+            self.assertEqual(self._upload(tmp + os.sep), expected)
+
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                self.assertEqual(self._upload("."), expected)
+            finally:
+                os.chdir(cwd)
+
+    def test_upload_large_single_file_process_count(self):
+        expected = {
+            1 * MEBIBYTE: 10,
+            256 * MEBIBYTE: 10,
+            257 * MEBIBYTE: 11,
+            512 * MEBIBYTE: 14,
+            640 * MEBIBYTE: 16,
+            4096 * MEBIBYTE: 32,
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            self._make_tree(tmp, {"big.tif": b"x"})
+            path = os.path.join(tmp, "big.tif")
+            for size, process_count in expected.items():
+                with patch.object(api_module.os.path, "getsize", return_value=size):
+                    self._upload(path)
+                self.assertEqual(FakeUploadManager.last_parallel_process_count, process_count, size)
+            self._upload(path, parallel_process_count=3)
+            self.assertEqual(FakeUploadManager.last_parallel_process_count, 3)
+
+    def test_upload_many_files_through_bounded_window(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            files = {f"d{i % 3}/f{i:03d}.tif": str(i).encode() for i in range(150)}
+            self._make_tree(tmp, files)
+            uploads = self._upload(tmp)
+        self.assertEqual(uploads, {f"batch1/{name}": data for name, data in files.items()})
+
+    @staticmethod
+    def _read_packs(uploads):
+        packs = {}
+        for name, data in uploads.items():
+            if name.endswith(".tar"):
+                with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+                    packs[name] = {m.name: (m.type, tar.extractfile(m).read() if m.isfile() else None) for m in tar}
+        return packs
+
+    def test_upload_pack_small(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            small = {f"s{i}.tif": bytes([65 + i]) * 100 for i in range(5)}
+            self._make_tree(tmp, dict(small, **{"big.tif": b"x" * 1000}))
+            uploads = self._upload(tmp, pack_small=True, pack_threshold=500, pack_size=250)
+
+        self.assertEqual(uploads.pop("batch1/big.tif"), b"x" * 1000)
+        packs = self._read_packs(uploads)
+        self.assertEqual(sorted(packs), [
+            "batch1/.forestsens-packs/packed-00000.tar",
+            "batch1/.forestsens-packs/packed-00001.tar",
+        ])
+        # A pack is closed once it holds at least pack_size bytes
+        self.assertEqual(sorted(len(members) for members in packs.values()), [2, 3])
+        members = {}
+        for pack in packs.values():
+            members.update(pack)
+        self.assertEqual(members, {name: (tarfile.REGTYPE, data) for name, data in small.items()})
+
+    def test_upload_pack_dereferences_symlinks(self):
+        with tempfile.TemporaryDirectory() as outside, tempfile.TemporaryDirectory() as tmp:
+            self._make_tree(outside, {"target.bin": b"payload"})
+            os.symlink(os.path.join(outside, "target.bin"), os.path.join(tmp, "link.tif"))
+            uploads = self._upload(tmp, pack_small=True)
+
+        packs = self._read_packs(uploads)
+        self.assertEqual(packs, {"batch1/.forestsens-packs/packed-00000.tar": {"link.tif": (tarfile.REGTYPE, b"payload")}})
+
+    def test_upload_pack_names_do_not_clash_with_inputs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self._make_tree(tmp, {"packed-00000.tar": b"x" * 1000, "a.tif": b"a"})
+            uploads = self._upload(tmp, pack_small=True, pack_threshold=500)
+
+        self.assertEqual(uploads.pop("batch1/packed-00000.tar"), b"x" * 1000)
+        self.assertEqual(list(uploads), ["batch1/.forestsens-packs/packed-00000.tar"])
+
+    def test_upload_pack_rejects_reserved_prefix(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self._make_tree(tmp, {".forestsens-packs/packed-00000.tar": b"x", "a.tif": b"a"})
+            with self.assertRaises(ValueError):
+                self._upload(tmp, pack_small=True)
+            self.assertEqual(FakeUploadManager.uploads, {})
+
+    def test_upload_pack_writer_failure_is_not_committed(self):
+        real_add = tarfile.TarFile.add
+
+        def failing_add(tar, name, arcname=None, **kwargs):
+            if arcname == "b.tif":
+                raise OSError("read error")
+            return real_add(tar, name, arcname=arcname, **kwargs)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            self._make_tree(tmp, {"a.tif": b"a" * 4096, "b.tif": b"b"})
+            with patch.object(tarfile.TarFile, "add", failing_add), \
+                    self.assertLogs("ForestSensAPI.api", level="ERROR") as logs:
+                uploads = self._upload(tmp, pack_small=True)
+
+        self.assertEqual(uploads, {})
+        self.assertIn("read error", "\n".join(logs.output))
+
+    def test_upload_shape(self):
+        self.assertEqual(_upload_shape([1024] * 100), (32, 8 * MEBIBYTE, 2))
+        self.assertEqual(_upload_shape([512 * MEBIBYTE] * 3), (3, 64 * MEBIBYTE, 8))
+
+    @patch("builtins.print")
+    def test_progress_is_throttled(self, mock_print):
+        progress = ForestSensAPI.SimpleProgress(100, "a.tif")
+        progress(10)
+        progress(10)
+        self.assertEqual(mock_print.call_count, 1)
+        progress(80)
+        self.assertEqual(mock_print.call_count, 2)
+
+    @patch.object(requests.Session, "head")
+    def test_prewarm_opens_connection(self, mock_head):
+        with patch("threading.Thread") as mock_thread:
+            api = ForestSensAPI()
+        mock_thread.return_value.start.assert_called_once()
+        mock_thread.call_args[1]["target"]()
+        mock_head.assert_called_once_with(api.base_url, timeout=5)
+        api.close()
+
+    def test_session_retry_policy(self):
+        retry = self.api._session.get_adapter("https://dummy.url").max_retries
+        self.assertEqual(retry.total, 5)
+        self.assertIn(503, retry.status_forcelist)
+        self.assertNotIn("POST", retry.allowed_methods)
+
+    def test_context_manager_closes_session(self):
+        with patch.object(requests.Session, "close") as mock_close:
+            with ForestSensAPI(prewarm=False) as api:
+                self.assertIsInstance(api._session, requests.Session)
+            mock_close.assert_called_once()
+
+
+@unittest.skipIf(async_api.httpx is None, "httpx is not installed")
+class TestAsyncForestSensAPI(unittest.TestCase):
+    def test_poll_until_done(self):
+        async def run():
+            async with AsyncForestSensAPI(prewarm=False) as api:
+                statuses = [{"status": "running"}, {"status": "Finished"}]
+                with patch.object(api, "aget_batch_status", AsyncMock(side_effect=statuses)) as mock_status:
+                    result = await api.poll_until_done(1, interval=0)
+                    self.assertEqual(mock_status.await_count, 2)
+                    return result
+
+        self.assertEqual(asyncio.run(run()), {"status": "Finished"})
+
+    def test_no_sync_prewarm(self):
+        async def run():
+            with patch("threading.Thread") as mock_thread:
+                async with AsyncForestSensAPI():
+                    pass
+            mock_thread.assert_not_called()
+
+        asyncio.run(run())
+
+    def test_poll_until_done_timeout(self):
+        async def run():
+            async with AsyncForestSensAPI(prewarm=False) as api:
+                with patch.object(api, "aget_batch_status", AsyncMock(return_value={"status": "running"})):
+                    await api.poll_until_done(1, interval=0.01, timeout=0.05)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(run())
+
+    def test_aget_raises_requests_errors(self):
+        async def run():
+            async with AsyncForestSensAPI(prewarm=False) as api:
+                error = async_api.httpx.ConnectError("refused")
+                with patch.object(api._async_client, "get", AsyncMock(side_effect=error)):
+                    await api.aget_batch_status(1)
+
+        with self.assertRaises(requests.exceptions.RequestException):
+            asyncio.run(run())
+
 
 if __name__ == '__main__':
     unittest.main()